@@ -0,0 +1,2 @@
+# pwdmgr — a command-line password manager. The implementation lives in
+# pwdmgr.core; main.py at the repo root is just a thin launcher for it.
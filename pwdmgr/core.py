@@ -0,0 +1,637 @@
+# os module lets us check if files exist on disk
+import os
+# sys gives us direct access to stdout so we can batch output writes
+import sys
+# hashlib lets us hash passwords (one-way encryption)
+import hashlib
+# hmac gives us compare_digest — a comparison that takes the same time
+# whether the first byte differs or the last one does
+import hmac
+# orjson is a C-accelerated JSON library — much faster than stdlib json
+# for serializing/parsing the vault as it grows
+import orjson
+# mmap maps the storage file into memory so we can parse it without
+# copying the whole thing into a Python bytes object first
+import mmap
+# getpass hides password input so it's not visible as you type
+import getpass
+# secrets generates cryptographically secure random characters
+import secrets
+# string gives us character sets: letters, digits, punctuation
+import string
+# time lets us measure how long a login attempt took and pad it out
+import time
+# base64 turns encrypted bytes into text we can store in JSON
+import base64
+# difflib finds near-matches so we can suggest sites on a typo
+import difflib
+
+# readline gives input() line editing and TAB completion. It's built in
+# on Linux/macOS; on Windows "pip install pyreadline3" provides it. If
+# neither is available, prompts still work — just without completion
+try:
+    import readline
+except ImportError:
+    try:
+        from pyreadline3 import Readline
+        readline = Readline()
+    except ImportError:
+        readline = None
+
+# ChaCha20-Poly1305 is an authenticated cipher: it encrypts AND detects
+# tampering. We use it to encrypt every stored password at rest
+from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
+
+# This is the file where we'll store everything
+STORAGE_FILE = "storage.json"
+
+# Pool of characters passwords are generated from, built once at import
+# time (as bytes, so a random byte value can index straight into it)
+PASSWORD_ALPHABET = (string.ascii_letters + string.digits + string.punctuation).encode()
+
+
+# scrypt cost parameters — memory-hard, so each guess costs the attacker
+# ~32 MB of RAM instead of one GPU-friendly SHA-256 round
+SCRYPT_PARAMS = {"n": 2 ** 15, "r": 8, "p": 1}
+
+
+def derive_key(password, salt, params=None):
+    # scrypt is a memory-hard KDF: ~100 ms for us at login, but it kills
+    # GPU cracking throughput if storage.json ever leaks
+    params = params or SCRYPT_PARAMS
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=params["n"],
+        r=params["r"],
+        p=params["p"],
+        maxmem=2 ** 26,  # OpenSSL's default cap is too small for n=2**15
+        dklen=32,
+    )
+
+
+def hash_password(password, salt, params=None):
+    return derive_key(password, salt, params).hex()
+
+
+def encrypt_password(key, password):
+    # A fresh random nonce per encryption — never reuse one with the
+    # same key. We store it next to the ciphertext; it's not secret
+    nonce = secrets.token_bytes(12)
+    ct = ChaCha20Poly1305(bytes(key)).encrypt(nonce, password.encode(), None)
+    return {
+        "nonce": base64.b64encode(nonce).decode(),
+        "ct": base64.b64encode(ct).decode(),
+    }
+
+
+def decrypt_password(key, record):
+    nonce = base64.b64decode(record["nonce"])
+    ct = base64.b64decode(record["ct"])
+    return ChaCha20Poly1305(bytes(key)).decrypt(nonce, ct, None).decode()
+
+
+# SHA-256 is only used for verifying legacy files below, but check up
+# front that this interpreter actually provides it. CPython delegates
+# sha256 to OpenSSL, which uses the SHA-NI CPU instructions on modern
+# x86-64 — if Python is built from source, point --with-openssl at a
+# libcrypto with SHA-NI enabled so any bulk re-hashing stays fast
+assert "sha256" in hashlib.algorithms_guaranteed
+
+
+# The old format hashed with a single unsalted SHA-256 — we keep this only
+# to recognize legacy files and upgrade them on the next successful login
+def legacy_hash_password(password):
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+# Generate a strong random password
+# secrets is safer than random — designed for security-sensitive tasks
+def generate_password(length=16):
+    chars = PASSWORD_ALPHABET
+    n = len(chars)
+    # 256 isn't a multiple of n, so byte values at the very top would make
+    # the low characters slightly more likely (modulo bias). We reject
+    # those values and draw again — same uniformity secrets.choice gives
+    max_ok = 256 - (256 % n)
+
+    out = bytearray()
+    while len(out) < length:
+        # One batched token_bytes call instead of one urandom read per
+        # character; double-size so one pass usually suffices
+        buf = secrets.token_bytes((length - len(out)) * 2)
+        out += bytes(chars[b % n] for b in buf if b < max_ok)
+    return out[:length].decode()
+
+
+# In memory, entries live in three parallel lists ("structure of arrays"):
+# sites[i], usernames[i] and passwords[i] belong together, and site_to_idx
+# maps a site name to its position i. Listing site names then walks one
+# flat list of strings instead of a dict of per-entry dicts.
+
+
+def new_data():
+    return {
+        "sites": [],
+        "usernames": [],
+        "passwords": [],
+        "site_to_idx": {},
+    }
+
+
+def put_entry(data, site, username, password):
+    # Insert a new entry, or overwrite the existing one in place
+    i = data["site_to_idx"].get(site)
+    if i is None:
+        data["site_to_idx"][site] = len(data["sites"])
+        data["sites"].append(site)
+        data["usernames"].append(username)
+        data["passwords"].append(password)
+    else:
+        data["usernames"][i] = username
+        data["passwords"][i] = password
+
+
+def drop_entry(data, site):
+    # Remove an entry by swapping the last row into its slot and popping —
+    # O(1) instead of shifting everything after it down
+    i = data["site_to_idx"].pop(site, None)
+    if i is None:
+        return False
+    last = len(data["sites"]) - 1
+    if i != last:
+        data["sites"][i] = data["sites"][last]
+        data["usernames"][i] = data["usernames"][last]
+        data["passwords"][i] = data["passwords"][last]
+        data["site_to_idx"][data["sites"][i]] = i
+    data["sites"].pop()
+    data["usernames"].pop()
+    data["passwords"].pop()
+    return True
+
+
+# The storage file is an append-only log: one JSON object per line.
+# The first line is an "init" header with the master-password record,
+# then each change is a "put" or "del" line. Adding or deleting one
+# entry appends one small line instead of rewriting the whole file.
+
+
+def append_op(op):
+    # "ab" = append bytes — existing lines are never touched
+    with open(STORAGE_FILE, "ab") as f:
+        f.write(orjson.dumps(op) + b"\n")
+        # fsync forces the line onto the disk platter/flash, not just the
+        # OS cache — one fsync per user action is the right trade-off
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def save_storage(data):
+    # Rewrite the whole log as a fresh snapshot: one init header plus one
+    # "put" line per live entry. Used on first setup and for compaction.
+    # Write to a temp file first, then atomically swap it into place.
+    # If we crash mid-write the old file is untouched — the previous
+    # truncate-then-write pattern could lose the whole vault
+    tmp = STORAGE_FILE + ".tmp"
+    # A 1 MiB buffer batches the per-entry writes into a few big syscalls
+    # instead of flushing every 8 KiB (the default buffer size)
+    with open(tmp, "wb", buffering=1 << 20) as f:
+        header = {"op": "init", "master_hash": data["master_hash"]}
+        for key in ("salt", "enc_salt", "kdf", "params"):
+            if key in data:
+                header[key] = data[key]
+        f.write(orjson.dumps(header) + b"\n")
+        # zip walks the three parallel lists in lockstep
+        rows = zip(data["sites"], data["usernames"], data["passwords"])
+        for site, username, password in rows:
+            if isinstance(password, dict):
+                # Encrypted record: nonce + ciphertext, both base64
+                entry = {"username": username, **password}
+            else:
+                # Plaintext from an old file that hasn't been upgraded yet
+                entry = {"username": username, "password": password}
+            f.write(orjson.dumps({"op": "put", "site": site, "entry": entry}) + b"\n")
+        # Make sure every byte is on disk BEFORE the rename below — if the
+        # rename landed first, a crash could leave an empty snapshot
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, STORAGE_FILE)
+
+
+def load_storage():
+    # Binary mode with a 1 MiB buffer: no text decoding, few syscalls.
+    # The mmap path below bypasses the buffer entirely for big files
+    with open(STORAGE_FILE, "rb", buffering=1 << 20) as f:
+        # Older versions stored one big JSON document instead of a log.
+        # Those files don't have an "op" key on the first line — parse them
+        # whole and rewrite in the new format so the upgrade happens once
+        first_line = f.readline()
+        if b'"op"' not in first_line:
+            old = orjson.loads(first_line + f.read())
+            data = new_data()
+            for key in ("master_hash", "salt", "enc_salt", "kdf", "params"):
+                if key in old:
+                    data[key] = old[key]
+            # The old format kept a dict of per-entry dicts — split it
+            # into the parallel lists
+            for site, entry in old["passwords"].items():
+                put_entry(data, site, entry["username"], entry["password"])
+            save_storage(data)
+            return data
+        f.seek(0)
+
+        # For a big vault, mmap lets the OS page cache back the parse
+        # directly — no user-space copy of the file. Tiny files skip it
+        # because mmap's setup cost dominates there
+        if os.path.getsize(STORAGE_FILE) < 4096:
+            return replay_log(f)
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return replay_log(mm)
+        finally:
+            mm.close()
+
+
+def replay_log(src):
+    # src is any binary source with .readline() — a file object or an mmap.
+    # Replay the log from the top to rebuild the in-memory columns
+    data = new_data()
+    lines_seen = 0
+    for line in iter(src.readline, b""):
+        line = line.strip()
+        if not line:
+            continue
+        op = orjson.loads(line)
+        lines_seen += 1
+        if op["op"] == "init":
+            for key in ("master_hash", "salt", "enc_salt", "kdf", "params"):
+                if key in op:
+                    data[key] = op[key]
+            data["sites"].clear()
+            data["usernames"].clear()
+            data["passwords"].clear()
+            data["site_to_idx"].clear()
+        elif op["op"] == "put":
+            entry = op["entry"]
+            if "ct" in entry:
+                password = {"nonce": entry["nonce"], "ct": entry["ct"]}
+            else:
+                password = entry["password"]
+            put_entry(data, op["site"], entry["username"], password)
+        elif op["op"] == "del":
+            # drop_entry ignores deletes of already-gone sites
+            drop_entry(data, op["site"])
+
+    # Compact once the log is mostly dead lines (old puts and dels) —
+    # rewriting the snapshot keeps replay time proportional to live data
+    if lines_seen > 2 * len(data["sites"]) + 32:
+        save_storage(data)
+    return data
+
+
+# When a site isn't found, suggest the closest saved names — catches
+# typos and stops near-duplicate entries from piling up
+def suggest_sites(data, site):
+    matches = difflib.get_close_matches(site, data["sites"], n=3)
+    if matches:
+        print(f"Did you mean: {', '.join(matches)}?")
+
+
+# Ask for a site name with TAB completion over the saved sites, so the
+# user can type "g<TAB>" instead of retyping "github" from scratch
+def input_site(prompt, data):
+    if readline is None:
+        return input(prompt).strip().lower()
+
+    def complete(text, state):
+        matches = [s for s in data["sites"] if s.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    old_completer = readline.get_completer()
+    readline.set_completer(complete)
+    readline.parse_and_bind("tab: complete")
+    try:
+        return input(prompt).strip().lower()
+    finally:
+        # Put back whatever completer was there before
+        readline.set_completer(old_completer)
+
+
+# First-time setup: ask user to create a master password
+def setup_master_password():
+    print("=== First Time Setup ===")
+
+    # Keep asking until both entries match
+    while True:
+        # getpass.getpass() hides the text as you type (shows nothing)
+        master = getpass.getpass("Create a master password: ")
+        confirm = getpass.getpass("Confirm master password: ")
+        if master == confirm:
+            break  # exit the loop — passwords match!
+        print("Passwords do not match. Try again.\n")
+
+    # Build the data structure to save
+    # We store the HASH, never the plain password
+    # Each store gets its own random salt so identical passwords
+    # in two different stores still produce different hashes
+    # Two independent salts: one for the login hash, one for the
+    # encryption key. If they shared a salt, the stored hash would BE
+    # the encryption key — anyone with the file could decrypt everything
+    salt = secrets.token_bytes(16)
+    enc_salt = secrets.token_bytes(16)
+    data = new_data()  # empty columns — no saved passwords yet
+    data["master_hash"] = hash_password(master, salt)
+    data["salt"] = salt.hex()
+    data["enc_salt"] = enc_salt.hex()
+    data["kdf"] = "scrypt"
+    data["params"] = SCRYPT_PARAMS
+
+    # bytearray (not bytes) so we can overwrite the key with zeros on exit
+    key = bytearray(derive_key(master, enc_salt))
+
+    save_storage(data)
+    print("Master password created successfully!\n")
+    return data, key
+
+
+# Verify master password — returns True if correct, False if not
+def verify_master_password(data):
+    print("=== Password Manager Login ===")
+
+    # Give the user 3 attempts
+    # range(3) gives us: 0, 1, 2
+    for attempt in range(3):
+        master = getpass.getpass("Enter master password: ")
+
+        # Every attempt is padded to the same wall-clock time below, so an
+        # attacker can't tell the cheap failure paths (legacy hash, missing
+        # keys) from a full scrypt computation
+        start = time.perf_counter()
+
+        # Hash what they typed, compare with stored hash
+        # We NEVER compare plain passwords — always compare hashes
+        if "salt" in data:
+            # Current format: scrypt with a stored per-store salt
+            salt = bytes.fromhex(data["salt"])
+            typed_hash = hash_password(master, salt, data.get("params"))
+        else:
+            # Legacy format: unsalted SHA-256 (64 hex chars, no salt key)
+            typed_hash = legacy_hash_password(master)
+
+        # compare_digest checks every byte before answering, so an attacker
+        # can't learn anything from how quickly a wrong guess is rejected
+        correct = hmac.compare_digest(typed_hash, data["master_hash"])
+
+        # Pad this attempt up to a fixed 250 ms budget (plus a few ms of
+        # random jitter so the exact floor isn't itself a signal)
+        elapsed = time.perf_counter() - start
+        time.sleep(max(0.0, 0.25 - elapsed) + secrets.randbelow(5) / 1000)
+
+        if correct:
+            # Older files get upgraded now that we know the password is
+            # right — "upgrade on login" migration
+            changed = False
+            if "salt" not in data:
+                # Legacy unsalted SHA-256 hash — re-hash with scrypt
+                salt = secrets.token_bytes(16)
+                data["master_hash"] = hash_password(master, salt)
+                data["salt"] = salt.hex()
+                data["kdf"] = "scrypt"
+                data["params"] = SCRYPT_PARAMS
+                changed = True
+            if "enc_salt" not in data:
+                # File predates encryption at rest — give it a key salt
+                data["enc_salt"] = secrets.token_bytes(16).hex()
+                changed = True
+
+            # Derive the vault encryption key from the master password.
+            # bytearray (not bytes) so we can zero it on exit
+            key = bytearray(
+                derive_key(master, bytes.fromhex(data["enc_salt"]), data.get("params"))
+            )
+
+            # Encrypt any entries still sitting in plaintext
+            for i, password in enumerate(data["passwords"]):
+                if isinstance(password, str):
+                    data["passwords"][i] = encrypt_password(key, password)
+                    changed = True
+
+            if changed:
+                save_storage(data)
+            print("Access granted!\n")
+            return key  # correct password — hand back the vault key
+
+        # Calculate remaining attempts: on attempt 0 → 2 left, attempt 1 → 1 left, attempt 2 → 0 left
+        remaining = 2 - attempt
+        print(f"Incorrect password. {remaining} attempt(s) remaining.")
+
+    print("Too many failed attempts. Exiting.")
+    return None  # all 3 attempts failed
+
+
+# Add a new password entry
+def add_password(data, key):
+    print("=== Add Password ===")
+
+    # .strip() removes leading/trailing spaces
+    # .lower() converts to lowercase so "Google" and "google" are the same site
+    site = input("Enter site/service name: ").strip().lower()
+    username = input("Enter username or email: ").strip()
+
+    # Offer to generate a password or enter manually
+    choice = input("Generate a strong password? (y/n): ").strip().lower()
+    if choice == "y":
+        length = input("Length? (press Enter for 16): ").strip()
+        length = int(length) if length.isdigit() else 16
+        password = generate_password(length)
+        print(f"Generated: {password}")
+    else:
+        # getpass hides the password as the user types it
+        password = getpass.getpass("Enter password: ")
+
+    # Encrypt before anything touches the lists or the disk — the
+    # plaintext only ever lives in this local variable
+    record = encrypt_password(key, password)
+
+    # Add a row to the parallel lists (or overwrite an existing site)
+    put_entry(data, site, username, record)
+
+    # Append one line to the log so it persists — without this, data is
+    # lost when the program closes
+    append_op({"op": "put", "site": site,
+               "entry": {"username": username, **record}})
+
+    print(f"Password for '{site}' saved!\n")
+
+
+# Look up a single site and show its credentials
+def view_password(data, key):
+    print("=== View Password ===")
+    site = input_site("Enter site name: ", data)
+
+    # Look up the site's row number in the index
+    i = data["site_to_idx"].get(site)
+    if i is not None:
+        # Decrypt only the one entry being viewed — the rest of the
+        # vault stays ciphertext in memory
+        password = data["passwords"][i]
+        if isinstance(password, dict):
+            password = decrypt_password(key, password)
+        print(f"\n  Site:     {site}")
+        print(f"  Username: {data['usernames'][i]}")
+        print(f"  Password: {password}\n")
+    else:
+        # site not found — tell the user instead of crashing
+        print(f"No entry found for '{site}'.")
+        suggest_sites(data, site)
+        print()
+
+
+# Show all saved site names (without passwords)
+def list_sites(data):
+    print("=== Saved Sites ===")
+
+    # Check if any sites are saved
+    if not data["sites"]:
+        print("No passwords saved yet.\n")
+        return  # exit the function early — nothing to show
+
+    # enumerate() gives us a counter alongside each item
+    # enumerate(["a","b"], 1) → (1,"a"), (2,"b")
+    # Only the flat sites list is touched — usernames and passwords
+    # stay untouched in their own lists. One write() instead of one
+    # print() per site means one syscall no matter how big the vault is
+    sys.stdout.write(
+        "".join(f"  {i}. {site}\n" for i, site in enumerate(data["sites"], 1)) + "\n"
+    )
+
+
+# Update an existing password entry
+def update_password(data, key):
+    print("=== Update Password ===")
+    list_sites(data)
+
+    if not data["sites"]:
+        return
+
+    site = input_site("Enter site name to update: ", data)
+
+    i = data["site_to_idx"].get(site)
+    if i is None:
+        print(f"No entry found for '{site}'.")
+        suggest_sites(data, site)
+        print()
+        return
+
+    print(f"Updating '{site}' — press Enter to keep current value.")
+
+    # Show current username and allow changing it
+    current_user = data["usernames"][i]
+    new_user = input(f"New username [{current_user}]: ").strip()
+    if new_user:  # only update if user typed something
+        data["usernames"][i] = new_user
+
+    # Offer generate or manual for new password
+    choice = input("Generate a new strong password? (y/n): ").strip().lower()
+    if choice == "y":
+        length = input("Length? (press Enter for 16): ").strip()
+        length = int(length) if length.isdigit() else 16
+        new_pass = generate_password(length)
+        print(f"Generated: {new_pass}")
+        data["passwords"][i] = encrypt_password(key, new_pass)
+    else:
+        new_pass = getpass.getpass("New password (press Enter to keep current): ")
+        if new_pass:  # only update if user typed something
+            data["passwords"][i] = encrypt_password(key, new_pass)
+
+    append_op({"op": "put", "site": site,
+               "entry": {"username": data["usernames"][i],
+                         **data["passwords"][i]}})
+    print(f"'{site}' updated!\n")
+
+
+# Delete a saved password entry
+def delete_password(data):
+    print("=== Delete Password ===")
+
+    # First show the list so user knows what exists
+    list_sites(data)
+
+    # If there's nothing to delete, list_sites already told them — just return
+    if not data["sites"]:
+        return
+
+    site = input_site("Enter site name to delete: ", data)
+
+    # One .get probe instead of an "in" check plus a second lookup later
+    if data["site_to_idx"].get(site) is not None:
+        # Ask for confirmation before deleting — safety check
+        confirm = input(f"Are you sure you want to delete '{site}'? (y/n): ").strip().lower()
+        if confirm == "y":
+            # drop_entry removes the row from all three lists
+            drop_entry(data, site)
+            append_op({"op": "del", "site": site})  # record the delete in the log
+            print(f"'{site}' deleted.\n")
+        else:
+            print("Cancelled.\n")  # user changed their mind
+    else:
+        print(f"No entry found for '{site}'.")
+        suggest_sites(data, site)
+        print()
+
+
+# The main menu — loops until user chooses to exit
+def show_menu(data, key):
+    while True:
+        print("=== Password Manager ===")
+        print("  1. Add password")
+        print("  2. View password")
+        print("  3. List all sites")
+        print("  4. Update password")
+        print("  5. Delete password")
+        print("  6. Exit")
+
+        # .strip() removes extra spaces the user might type
+        choice = input("Choose an option (1-6): ").strip()
+
+        # Check what the user picked
+        if choice == "1":
+            add_password(data, key)
+        elif choice == "2":
+            view_password(data, key)
+        elif choice == "3":
+            list_sites(data)
+        elif choice == "4":
+            update_password(data, key)
+        elif choice == "5":
+            delete_password(data)
+        elif choice == "6":
+            print("Goodbye!")
+            break  # exit the while loop → program ends
+        else:
+            # Anything other than 1-6
+            print("Invalid option. Try again.\n")
+
+
+# --- MAIN PROGRAM ---
+def main():
+    if os.path.exists(STORAGE_FILE):
+        data = load_storage()
+        key = verify_master_password(data)
+    else:
+        data, key = setup_master_password()
+
+    if key is not None:
+        try:
+            show_menu(data, key)
+        finally:
+            # Overwrite the key bytes before the process exits so the
+            # plaintext key doesn't linger in memory longer than needed
+            for i in range(len(key)):
+                key[i] = 0
+
+
+# This guard means: only run if this file is executed directly
+# If another file imports this one, main() won't run automatically
+if __name__ == "__main__":
+    main()